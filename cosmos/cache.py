@@ -44,7 +44,7 @@ from cosmos.constants import (
     FILE_SCHEME_AIRFLOW_DEFAULT_CONN_ID_MAP,
     PACKAGE_LOCKFILE_YML,
 )
-from cosmos.dbt.project import get_partial_parse_path
+from cosmos.dbt.project import _YamlLoader, get_partial_parse_path
 from cosmos.log import get_logger
 from cosmos.settings import (
     cache_dir,
@@ -707,9 +707,7 @@ def is_cache_package_lockfile_enabled(project_dir: Path) -> bool:
 
 def _get_sha1_hash(yaml_file: Path) -> str:
     """Read package-lock.yml file and return sha1_hash"""
-    with open(yaml_file) as file:
-        yaml_content = file.read()
-    data = yaml.safe_load(yaml_content)
+    data = yaml.load(Path(yaml_file).read_bytes(), Loader=_YamlLoader)
     sha1_hash: str = data.get("sha1_hash", "")
     return sha1_hash
 
@@ -66,8 +66,9 @@ def _resolve_glue_namespace(profile: dict[str, Any]) -> str:
     which causes ``get_dataset_namespace`` to treat it as a failed resolution.
     """
     region = profile.get("region", "us-east-1")
-    if "account_id" in profile and profile["account_id"]:
-        return f"arn:aws:glue:{region}:{profile['account_id']}"
+    account_id = profile.get("account_id")
+    if account_id:
+        return f"arn:aws:glue:{region}:{account_id}"
     role_arn = profile.get("role_arn")
     if isinstance(role_arn, str) and role_arn:
         parts = role_arn.split(":")
@@ -7,6 +7,8 @@ import itertools
 import json
 import os
 import platform
+import re
+import sys
 import tempfile
 import warnings
 import zlib
@@ -99,6 +101,12 @@ def _relative_dirs(paths: list[Path], project_path: Path | None) -> list[str] |
     return result
 
 
+_NON_WHITESPACE_PATTERN = re.compile(r"\S")
+_NON_WHITESPACE_BYTE_PATTERN = re.compile(rb"\S")
+# Characters a JSON document can start with, once leading whitespace is skipped
+_JSON_VALUE_FIRST_CHARS = frozenset('{["-0123456789tfn')
+
+
 class CosmosLoadDbtException(Exception):
     """
     Exception raised while trying to load a `dbt` project as a `DbtGraph` instance.
@@ -107,6 +115,30 @@ class CosmosLoadDbtException(Exception):
     pass
 
 
+def _check_manifest_root(content: str | bytes, manifest_path: Path | ObjectStoragePath) -> None:
+    """
+    Fail fast on manifest content that is empty or cannot be JSON at all, before handing it to the parser.
+
+    Content that starts like a JSON value is left to the parser, so malformed JSON and valid JSON whose root is not
+    an object are still reported as such.
+
+    :param content: Raw content of the manifest file.
+    :param manifest_path: Path of the manifest, used in error messages.
+    """
+    if isinstance(content, bytes):
+        byte_match = _NON_WHITESPACE_BYTE_PATTERN.search(content)
+        first_char = byte_match.group().decode("latin-1") if byte_match else None
+    else:
+        str_match = _NON_WHITESPACE_PATTERN.search(content)
+        first_char = str_match.group() if str_match else None
+    if first_char is None:
+        raise CosmosLoadDbtException(f"Failed to load dbt manifest at `{manifest_path}`: file is empty")
+    if first_char not in _JSON_VALUE_FIRST_CHARS:
+        raise CosmosLoadDbtException(
+            f"Failed to load dbt manifest at `{manifest_path}`: file is not valid JSON (content starts with {first_char!r})"
+        )
+
+
 @dataclass
 class DbtNode:
     """
@@ -302,6 +334,42 @@ def is_freshness_effective(freshness: dict[str, Any] | None) -> bool:
     return False
 
 
+_RESOURCE_TYPE_MAP: dict[str, DbtResourceType] = {
+    resource_type.value: resource_type for resource_type in DbtResourceType  # type: ignore[attr-defined]
+}
+
+
+def _get_resource_type(value: str) -> DbtResourceType:
+    """
+    Return the DbtResourceType for a raw ``resource_type`` string from ``manifest.json`` or ``dbt ls``.
+
+    Known values are resolved with a dictionary lookup instead of going through the enum constructor for every node.
+    Unknown values still go through ``DbtResourceType`` (which extends the enum) and are then remembered.
+    """
+    resource_type = _RESOURCE_TYPE_MAP.get(value)
+    if resource_type is None:
+        resource_type = DbtResourceType(value)
+        _RESOURCE_TYPE_MAP[value] = resource_type
+    return resource_type
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern ``value`` if it is a plain string, otherwise return it unchanged.
+
+    Package names and tags repeat across most nodes of a project, so interning them lets every node share a single
+    string object instead of holding its own copy decoded from the manifest or ``dbt ls`` output.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_tags(tags: Any) -> Any:
+    """Intern each tag of a ``tags`` list, otherwise return the (malformed) value unchanged."""
+    if isinstance(tags, list):
+        return [_intern(tag) for tag in tags]
+    return tags
+
+
 def _classify_resource_type(resource_type: DbtResourceType, config: dict[str, Any]) -> DbtResourceType:
     """Reclassify adapter-native semantic layer materializations as DbtResourceType.SEMANTIC_LAYER."""
     materialization = str(config.get("materialized") or "").lower()
@@ -438,15 +506,17 @@ def parse_dbt_ls_output(project_path: Path | None, ls_stdout: str) -> dict[str,
 
             try:
                 node_config = node_dict.get("config") or {}
-                node_resource_type = _classify_resource_type(DbtResourceType(node_dict["resource_type"]), node_config)
+                node_resource_type = _classify_resource_type(
+                    _get_resource_type(node_dict["resource_type"]), node_config
+                )
                 node = DbtNode(
                     unique_id=node_dict["unique_id"],
-                    package_name=node_dict.get("package_name"),
+                    package_name=_intern(node_dict.get("package_name")),
                     resource_type=node_resource_type,
                     depends_on=node_dict.get("depends_on", {}).get("nodes", []),
                     path_base=base_path,
                     original_file_path=Path(_normalize_path(node_file_path)),
-                    tags=node_dict.get("tags") or [],
+                    tags=_intern_tags(node_dict.get("tags") or []),
                     config=node_config,
                     has_freshness=(
                         is_freshness_effective(node_dict.get("freshness"))
@@ -482,14 +552,14 @@ def _build_dbt_node_from_manifest_resource(
         )
         return None
 
-    package_name = node_dict.get("package_name")
+    package_name = _intern(node_dict.get("package_name"))
     is_root_project_node = manifest_project_name is None or (package_name == manifest_project_name)
     if package_name and not is_root_project_node:
         path_base = project_path / packages_subpath / package_name
     else:
         path_base = project_path
 
-    resource_type = DbtResourceType(node_dict["resource_type"])
+    resource_type = _get_resource_type(node_dict["resource_type"])
     config = node_dict.get("config") or {}
     return DbtNode(
         unique_id=unique_id,
@@ -498,7 +568,7 @@ def _build_dbt_node_from_manifest_resource(
         depends_on=node_dict.get("depends_on", {}).get("nodes", []),
         path_base=path_base,
         original_file_path=Path(_normalize_path(original_file_path)),
-        tags=node_dict.get("tags") or [],
+        tags=_intern_tags(node_dict.get("tags") or []),
         config=config,
         has_freshness=(
             is_freshness_effective(node_dict.get("freshness")) if resource_type == DbtResourceType.SOURCE else False
@@ -507,6 +577,17 @@ def _build_dbt_node_from_manifest_resource(
     )
 
 
+def _load_remote_cache_file(remote_cache_key_path: Path | ObjectStoragePath) -> dict[str, Any]:
+    """Load a JSON cache file from the remote cache directory, or return an empty dict if it does not exist."""
+    # Opening directly, instead of checking ``exists()`` first, saves one round trip to the object store
+    try:
+        with remote_cache_key_path.open("r") as fp:
+            cache_dict: dict[str, Any] = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    return cache_dict
+
+
 class DbtGraph:
     """
     A dbt project graph (represented by `nodes` and `filtered_nodes`).
@@ -740,12 +821,8 @@ class DbtGraph:
 
     def _get_dbt_ls_remote_cache(self, remote_cache_dir: Path | ObjectStoragePath) -> dict[str, str]:
         """Loads the remote cache for dbt ls."""
-        cache_dict: dict[str, str] = {}
         remote_cache_key_path = remote_cache_dir / self.cache_key / "dbt_ls_cache.json"
-        if remote_cache_key_path.exists():
-            with remote_cache_key_path.open("r") as fp:
-                cache_dict = json.load(fp)
-        return cache_dict
+        return _load_remote_cache_file(remote_cache_key_path)
 
     def get_dbt_ls_cache(self) -> dict[str, str]:
         """
@@ -1168,12 +1245,8 @@ class DbtGraph:
 
     def _get_yaml_selectors_remote_cache(self, remote_cache_dir: Path | ObjectStoragePath) -> dict[str, Any]:
         """Loads the remote cache for the yaml selectors."""
-        cache_dict: dict[str, Any] = {}
         remote_cache_key_path = remote_cache_dir / self.cache_key / "yaml_selectors_cache.json"
-        if remote_cache_key_path.exists():
-            with remote_cache_key_path.open("r") as fp:
-                cache_dict = json.load(fp)
-        return cache_dict
+        return _load_remote_cache_file(remote_cache_key_path)
 
     def get_yaml_selectors_cache(self) -> dict[str, Any]:
         """
@@ -1409,9 +1482,8 @@ class DbtGraph:
         try:
             with manifest_path.open(open_mode) as fp:
                 content = fp.read()
-                if not content or content.isspace():
-                    raise CosmosLoadDbtException(f"Failed to load dbt manifest at `{manifest_path}`: file is empty")
-                manifest = parse_function(content)
+            _check_manifest_root(content, manifest_path)
+            manifest = parse_function(content)
         except decode_errors as e:
             raise CosmosLoadDbtException(
                 f"Failed to load dbt manifest at `{manifest_path}`: file is not valid JSON ({e})"
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import sys
+import threading
+from collections import OrderedDict
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 import yaml
 from jinja2 import Template
@@ -28,6 +32,17 @@ from cosmos.log import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml C bindings when PyYAML was built with them; they parse considerably faster than the
+# pure-Python SafeLoader and accept the same documents.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Process-wide LRU cache of parsed ``dbt_project.yml`` files, keyed by ``(path, st_mtime_ns, st_size)`` so that
+# editing the file invalidates its entry. Several task groups commonly share the same dbt project, and each of
+# them would otherwise re-read and re-parse the same file.
+_DBT_PROJECT_YML_CACHE: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+_DBT_PROJECT_YML_CACHE_MAX_SIZE = 64
+_dbt_project_yml_cache_lock = threading.Lock()
+
 
 def has_non_empty_dependencies_file(project_path: Path) -> bool:
     """
@@ -36,16 +51,31 @@ def has_non_empty_dependencies_file(project_path: Path) -> bool:
     :param project_path: Path to the project
     :returns: True or False
     """
-    project_dir = Path(project_path)
-    for filename in DBT_DEPENDENCIES_FILE_NAMES:
-        filepath = project_dir / filename
-        if filepath.exists() and filepath.stat().st_size > 0:
-            return True
+    # A single directory read, rather than an ``exists()`` and a ``stat()`` call per candidate file name.
+    try:
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                if entry.name in DBT_DEPENDENCIES_FILE_NAMES and entry.is_file() and entry.stat().st_size > 0:
+                    return True
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     logger.info("Project %s does not have %s", project_path, DBT_DEPENDENCIES_FILE_NAMES)
     return False
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_template(template_str: str) -> Template:
+    """
+    Compile the given Jinja template string, reusing the compiled template for repeated inputs.
+
+    Compiling is the expensive part of rendering and only depends on the string, while rendering depends on the
+    environment variables at call time, so only the former is cached.
+    """
+    template: Template = Template(template_str)
+    return template
+
+
 def _resolve_env_var(template_str: str) -> str:
     """
     Given a Jinja template string, resolve the environment variables, declared using the dbt syntax,
@@ -62,11 +92,39 @@ def _resolve_env_var(template_str: str) -> str:
     def env_var(name: str, default: str = "") -> str:
         return os.getenv(name, default)
 
-    template = Template(template_str)
+    template = _compile_template(template_str)
     rendered: str = template.render(env_var=env_var)
     return rendered
 
 
+def _load_dbt_project_yml(dbt_project_yml_path: Path) -> Any:
+    """
+    Return the parsed content of the given ``dbt_project.yml``, reusing a previous parse while the file is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+
+    :param dbt_project_yml_path: Path to the ``dbt_project.yml`` file
+    :raises FileNotFoundError: If the file does not exist
+    :raises yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = os.stat(dbt_project_yml_path)
+    key = (str(dbt_project_yml_path), stat.st_mtime_ns, stat.st_size)
+    with _dbt_project_yml_cache_lock:
+        if key in _DBT_PROJECT_YML_CACHE:
+            _DBT_PROJECT_YML_CACHE.move_to_end(key)
+            return _DBT_PROJECT_YML_CACHE[key]
+
+    # Handing the whole file to the loader as bytes lets libyaml parse it in one go instead of pulling it
+    # through Python-level read() calls
+    content = yaml.load(Path(dbt_project_yml_path).read_bytes(), Loader=_YamlLoader)
+
+    with _dbt_project_yml_cache_lock:
+        _DBT_PROJECT_YML_CACHE[key] = content
+        if len(_DBT_PROJECT_YML_CACHE) > _DBT_PROJECT_YML_CACHE_MAX_SIZE:
+            _DBT_PROJECT_YML_CACHE.popitem(last=False)
+    return content
+
+
 def get_dbt_packages_subpath(source_folder: Path) -> str:
     """
     Return the dbt project's package installation sub path.
@@ -83,15 +141,15 @@ def get_dbt_packages_subpath(source_folder: Path) -> str:
     """
     subpath = DBT_DEFAULT_PACKAGES_FOLDER
     dbt_project_yml_path = source_folder / DBT_PROJECT_FILENAME
-    if dbt_project_yml_path.exists():
-        with open(dbt_project_yml_path) as fp:
-            try:
-                dbt_project_file_content = yaml.safe_load(fp)
-            except yaml.YAMLError:
-                logger.info("Unable to read the %s file", DBT_PROJECT_FILENAME)
-            else:
-                if isinstance(dbt_project_file_content, dict):
-                    subpath = dbt_project_file_content.get("packages-install-path", DBT_DEFAULT_PACKAGES_FOLDER)
+    try:
+        dbt_project_file_content = _load_dbt_project_yml(dbt_project_yml_path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    except yaml.YAMLError:
+        logger.info("Unable to read the %s file", DBT_PROJECT_FILENAME)
+    else:
+        if isinstance(dbt_project_file_content, dict):
+            subpath = dbt_project_file_content.get("packages-install-path", DBT_DEFAULT_PACKAGES_FOLDER)
     return _resolve_env_var(subpath)
 
 
@@ -128,14 +186,13 @@ def copy_manifest_file_if_exists(source_manifest: str | Path, dbt_project_folder
     :param source_manifest: manifest.json filepath
     :param dbt_project_folder: destination dbt project folder (it will be copied to the target folder)
     """
-    dbt_project_folder = Path(dbt_project_folder)
+    # Checked as a string: an empty path must be skipped, whereas ``Path("")`` would resolve to the current directory
     source_manifest = str(source_manifest)
-    if source_manifest and Path(source_manifest).exists():
+    if source_manifest and os.path.exists(source_manifest):
         logger.info("Copying the manifest from %s...", source_manifest)
-        target_folder_path = dbt_project_folder / DBT_TARGET_DIR_NAME
-        tmp_manifest_filepath = target_folder_path / DBT_MANIFEST_FILE_NAME
-        Path(target_folder_path).mkdir(parents=True, exist_ok=True)
-        shutil.copy(source_manifest, tmp_manifest_filepath)
+        target_folder_path = Path(dbt_project_folder) / DBT_TARGET_DIR_NAME
+        target_folder_path.mkdir(parents=True, exist_ok=True)
+        shutil.copy(source_manifest, target_folder_path / DBT_MANIFEST_FILE_NAME)
 
 
 def dbt_project_path_bundle_hint(project_path: Path | str | None) -> str:
@@ -171,22 +228,35 @@ def dbt_project_path_bundle_hint(project_path: Path | str | None) -> str:
     )
 
 
+# Project entries that are never symlinked into the temporary project directory. The dbt packages folder is only
+# known per project (and may depend on environment variables), so ``create_symlinks`` adds it at call time.
+_SYMLINK_IGNORED_NAMES = frozenset({DBT_LOG_DIR_NAME, DBT_TARGET_DIR_NAME, PACKAGE_LOCKFILE_YML, "profiles.yml"})
+
+
 def create_symlinks(project_path: Path, tmp_dir: Path, ignore_dbt_packages: bool) -> None:
     """Helper function to create symlinks to the dbt project files."""
-    ignore_paths = [DBT_LOG_DIR_NAME, DBT_TARGET_DIR_NAME, PACKAGE_LOCKFILE_YML, "profiles.yml"]
+    ignore_paths = _SYMLINK_IGNORED_NAMES
     if ignore_dbt_packages:
         dbt_packages_subpath = get_dbt_packages_subpath(project_path)
         # this is linked to dbt deps so if dbt deps is true then ignore existing dbt_packages folder
-        ignore_paths.append(dbt_packages_subpath)
+        ignore_paths = ignore_paths | {dbt_packages_subpath}
     try:
-        child_names = os.listdir(project_path)
+        entries = os.scandir(project_path)
     except FileNotFoundError:
         raise CosmosValueError(
             f"Could not find the dbt project at {project_path}" + dbt_project_path_bundle_hint(project_path)
         )
-    for child_name in child_names:
-        if child_name not in ignore_paths:
-            os.symlink(project_path / child_name, tmp_dir / child_name)
+    # ``os.scandir`` yields the entries from a single directory read and ``entry.path`` is already joined, so no
+    # ``Path`` objects need to be built per child. Links are created relative to a descriptor of ``tmp_dir`` so the
+    # kernel does not resolve the whole ``tmp_dir`` path again for every child.
+    with entries:
+        tmp_dir_fd = os.open(tmp_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for entry in entries:
+                if entry.name not in ignore_paths:
+                    os.symlink(entry.path, entry.name, dir_fd=tmp_dir_fd)
+        finally:
+            os.close(tmp_dir_fd)
 
 
 def get_partial_parse_path(project_dir_path: Path) -> Path:
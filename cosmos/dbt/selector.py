@@ -6,7 +6,7 @@ import inspect
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -58,6 +58,24 @@ def _fqn_matches(node_fqn: str, fqn_selector_value: str) -> bool:
     return node_fqn == fqn_selector_value
 
 
+# Sentinel distinguishing a missing key from a key explicitly set to ``None``
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _parse_nested_value_pattern(pattern: str) -> tuple[tuple[str, ...], str]:
+    """
+    Split a pattern such as "config.meta.frequency:daily" into its key path and expected value.
+
+    The same pattern is checked against every node in the project, so it is only parsed once.
+
+    :param pattern: a string containing a dotted path that reference dictionary keys and a value
+    :return: a tuple with the keys path (e.g. ("config", "meta", "frequency")) and the expected value (e.g. "daily")
+    """
+    keys, expected_value = pattern.split(":")
+    return tuple(keys.split(".")), expected_value
+
+
 def _check_nested_value_in_dict(dict_: dict[Any, Any], pattern: str) -> bool:
     """
     Given a dictionary dict_, identify if the pattern defined in pattern happens on the dictionary.
@@ -78,18 +96,16 @@ def _check_nested_value_in_dict(dict_: dict[Any, Any], pattern: str) -> bool:
         assert self._check_nested_value_in_dict(dict_, pattern)
 
     """
-    keys, expected_value = pattern.split(":")
-    keys_values = keys.split(".")
+    keys_values, expected_value = _parse_nested_value_pattern(pattern)
 
-    current: dict[Any, Any] | str = dict_
+    current: Any = dict_
     for key in keys_values:
         if isinstance(current, dict):
-            if key in current:
-                current = current[key]
-            else:
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
                 return False  # Key path doesn't exist
 
-    return current == expected_value
+    return bool(current == expected_value)
 
 
 @dataclass
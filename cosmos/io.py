@@ -3,6 +3,8 @@ from __future__ import annotations
 import io
 import os
 import tarfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -19,6 +21,9 @@ from cosmos import settings
 from cosmos.constants import DEFAULT_TARGET_PATH, FILE_SCHEME_AIRFLOW_DEFAULT_CONN_ID_MAP
 from cosmos.exceptions import CosmosValueError
 
+# Uploads to object storage are network-bound, so a few of them can run concurrently.
+_CLOUD_STORAGE_UPLOAD_MAX_WORKERS = 8
+
 
 def upload_to_aws_s3(
     project_dir: str,
@@ -56,8 +61,9 @@ def upload_to_aws_s3(
         with tarfile.open(fileobj=buf, mode="w:gz") as tar:
             tar.add(target_dir, arcname=source_subpath)
         buf.seek(0)
-        hook.load_bytes(
-            bytes_data=buf.read(),
+        # Stream the archive from the buffer rather than materializing a second full-size copy with ``buf.read()``
+        hook.load_file_obj(
+            file_obj=buf,
             bucket_name=bucket_name,
             key=f"{run_prefix}/{source_subpath}.tar.gz",
             replace=True,
@@ -244,6 +250,19 @@ def _construct_dest_file_path(
     return f"{root}/{'/'.join(segments)}"
 
 
+def _upload_files_concurrently(upload_file: Callable[[str], None], file_paths: list[str]) -> None:
+    """
+    Call ``upload_file`` for each of the given file paths on a thread pool.
+
+    :param upload_file: Function that uploads a single local file to its remote destination.
+    :param file_paths: Local paths of the files to upload.
+    """
+    max_workers = max(1, min(_CLOUD_STORAGE_UPLOAD_MAX_WORKERS, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consuming the results re-raises the first upload error, if any
+        list(executor.map(upload_file, file_paths))
+
+
 def upload_to_cloud_storage(project_dir: str, source_subpath: str = DEFAULT_TARGET_PATH, **kwargs: Any) -> None:
     """
     Helper function demonstrating how to upload files to remote object stores that can be used as a callback. This is
@@ -253,7 +272,7 @@ def upload_to_cloud_storage(project_dir: str, source_subpath: str = DEFAULT_TARG
     :param project_dir: Path of the cloned project directory which Cosmos tasks work from.
     :param source_subpath: Path of the source directory sub-path to upload files from.
     """
-    dest_target_dir, dest_conn_id = _configure_remote_target_path()
+    dest_target_dir, _ = _configure_remote_target_path()
 
     if not dest_target_dir:
         raise CosmosValueError("You're trying to upload artifact files, but the remote target path is not configured.")
@@ -269,13 +288,17 @@ def upload_to_cloud_storage(project_dir: str, source_subpath: str = DEFAULT_TARG
         f"/{context['task_instance'].try_number}"
     )
 
-    for file_path in files:
+    def _upload_file(file_path: str) -> None:
         rel_path = os.path.relpath(file_path, source_target_dir)
         dest_file_path = _construct_dest_file_path(
-            dest_target_dir,
+            None,
             rel_path,
             task_run_identifier,
             source_subpath,
         )
-        dest_object_storage_path = ObjectStoragePath(dest_file_path, conn_id=dest_conn_id)
+        # Deriving the destination from the configured target path reuses its connection and filesystem,
+        # rather than resolving the Airflow connection again for every file
+        dest_object_storage_path = dest_target_dir / dest_file_path
         ObjectStoragePath(file_path).copy(dest_object_storage_path)
+
+    _upload_files_concurrently(_upload_file, files)
@@ -22,7 +22,7 @@ from airflow.utils.strings import to_boolean
 from packaging.version import Version
 
 from cosmos.airflow.compatibility import AirflowSkipException
-from cosmos.io import _construct_dest_file_path
+from cosmos.io import _construct_dest_file_path, _upload_files_concurrently
 
 if TYPE_CHECKING:  # pragma: no cover
     try:
@@ -365,7 +365,7 @@ class AbstractDbtLocalBase(AbstractDbtBase):
     def _upload_sql_files(self, tmp_project_dir: str, resource_type: str) -> None:
         start_time = time.time()
 
-        dest_target_dir, dest_conn_id = self._configure_remote_target_path()
+        dest_target_dir, _ = self._configure_remote_target_path()
 
         if not dest_target_dir:
             raise CosmosValueError("You're trying to upload SQL files, but the remote target path is not configured. ")
@@ -375,16 +375,18 @@ class AbstractDbtLocalBase(AbstractDbtBase):
 
         source_run_dir = Path(tmp_project_dir) / f"target/{resource_type}"
         files = [str(file) for file in source_run_dir.rglob("*") if file.is_file()]
-        for file_path in files:
+
+        def _upload_file(file_path: str) -> None:
             rel_path = os.path.relpath(file_path, source_run_dir)
-            dest_file_path = _construct_dest_file_path(
-                dest_target_dir, rel_path, dag_task_group_identifier, run_id, resource_type
-            )
-            dest_object_storage_path = ObjectStoragePath(dest_file_path, conn_id=dest_conn_id)
+            dest_file_path = _construct_dest_file_path(None, rel_path, dag_task_group_identifier, run_id, resource_type)
+            # Derived from the configured target path, so its connection is not resolved again for every file
+            dest_object_storage_path = dest_target_dir / dest_file_path
             dest_object_storage_path.parent.mkdir(parents=True, exist_ok=True)
             ObjectStoragePath(file_path).copy(dest_object_storage_path)
             self.log.debug("Copied %s to %s", file_path, dest_object_storage_path)
 
+        _upload_files_concurrently(_upload_file, files)
+
         elapsed_time = time.time() - start_time
         self.log.info("SQL files upload completed in %.2f seconds.", elapsed_time)
 
@@ -123,14 +123,14 @@ except SdkConfigException:
     LINEAGE_NAMESPACE = os.getenv("OPENLINEAGE_NAMESPACE", DEFAULT_OPENLINEAGE_NAMESPACE)
 
 
+_FALSY_STRINGS = frozenset({"f", "false", "0", "", "none"})
+
+
 def convert_to_boolean(value: str | None) -> bool:
     """
     Convert a string that represents a boolean to a Python boolean.
     """
-    value = str(value).lower().strip()
-    if value in ("f", "false", "0", "", "none"):
-        return False
-    return True
+    return str(value).lower().strip() not in _FALSY_STRINGS
 
 
 # Telemetry-related settings
@@ -11,6 +11,7 @@ import yaml
 
 from cosmos.dbt.parser.project import DbtModel, DbtModelType, LegacyDbtProject
 from cosmos.exceptions import CosmosValueError
+from tests.utils import YamlDumper
 
 DBT_PROJECT_PATH = Path(__name__).parent.parent.parent.parent.parent / "dev/dags/dbt/"
 SAMPLE_CSV_PATH = DBT_PROJECT_PATH / "jaffle_shop/seeds/raw_customers.csv"
@@ -95,7 +96,7 @@ def test_LegacyDbtProject__handle_config_file_empty_file():
 def test_LegacyDbtProject__handle_config_file_with_unknown_name():
     yaml_data = {"models": [{"name": "unknown"}]}
     with NamedTemporaryFile("w") as tmp_fp:
-        yaml.dump(yaml_data, tmp_fp)
+        yaml.dump(yaml_data, tmp_fp, Dumper=YamlDumper)
         tmp_fp.flush()
 
         sample_config_file_path = Path(tmp_fp.name)
@@ -121,7 +122,7 @@ def test_LegacyDbtProject__handle_config_file_with_selector(input_tags, expected
 
     with NamedTemporaryFile("w") as tmp_fp:
         yaml_data = {"models": [{"name": "orders", "config": {"tags": input_tags}}]}
-        yaml.dump(yaml_data, tmp_fp)
+        yaml.dump(yaml_data, tmp_fp, Dumper=YamlDumper)
         tmp_fp.flush()
 
         sample_config_file_path = Path(tmp_fp.name)
@@ -177,7 +178,7 @@ def test_LegacyDbtProject_yml_config_applies_across_dirs(tmp_path):
 
     yaml_data = {"models": [{"name": "model_b", "config": {"tags": ["from_marts_yml"]}}]}
     with open(project_dir / "marts" / "schema.yml", "w") as fp:
-        yaml.dump(yaml_data, fp)
+        yaml.dump(yaml_data, fp, Dumper=YamlDumper)
 
     dbt_project = LegacyDbtProject(
         project_name="cross_dir_config_project",
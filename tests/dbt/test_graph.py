@@ -5,8 +5,8 @@ import logging
 import os
 import shutil
 import sys
-import tempfile
 import zlib
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from subprocess import PIPE, Popen
@@ -32,6 +32,8 @@ from cosmos.dbt.graph import (
     DbtGraph,
     DbtNode,
     LoadMode,
+    _check_manifest_root,
+    _get_resource_type,
     _normalize_path,
     _relative_dirs,
     parse_dbt_ls_output,
@@ -79,33 +81,27 @@ def _ignore_when_copying_dbt_project(directory: str, names: list[str]) -> list[s
 
 
 @pytest.fixture
-def tmp_dbt_project_dir():
+def tmp_dbt_project_dir(tmp_path):
     """
     Creates a plain dbt project structure, which does not contain logs or target folders.
     """
     source_proj_dir = DBT_PROJECTS_ROOT_DIR / DBT_PROJECT_NAME
 
-    tmp_dir = Path(tempfile.mkdtemp())
-    target_proj_dir = tmp_dir / DBT_PROJECT_NAME
+    target_proj_dir = tmp_path / DBT_PROJECT_NAME
     shutil.copytree(source_proj_dir, target_proj_dir, ignore=_ignore_when_copying_dbt_project)
-    yield tmp_dir
-
-    shutil.rmtree(tmp_dir, ignore_errors=True)  # delete directory
+    return tmp_path
 
 
 @pytest.fixture
-def tmp_altered_dbt_project_dir():
+def tmp_altered_dbt_project_dir(tmp_path):
     """
     Creates a plain dbt project structure, which does not contain logs or target folders.
     """
     source_proj_dir = DBT_PROJECTS_ROOT_DIR / ALTERED_DBT_PROJECT_NAME
 
-    tmp_dir = Path(tempfile.mkdtemp())
-    target_proj_dir = tmp_dir / ALTERED_DBT_PROJECT_NAME
+    target_proj_dir = tmp_path / ALTERED_DBT_PROJECT_NAME
     shutil.copytree(source_proj_dir, target_proj_dir, ignore=_ignore_when_copying_dbt_project)
-    yield tmp_dir
-
-    shutil.rmtree(tmp_dir, ignore_errors=True)  # delete directory
+    return tmp_path
 
 
 @pytest.fixture
@@ -178,6 +174,63 @@ def test_dbt_node_checksum_is_none_when_seed_file_missing(tmp_path):
     assert node.checksum is None
 
 
+def test_dbt_node_checksum_is_computed_once(tmp_path):
+    (tmp_path / "my_seed.csv").write_bytes(b"id\n1\n")
+    node = DbtNode(
+        unique_id="seed.my_project.my_seed",
+        resource_type=DbtResourceType.SEED,
+        depends_on=[],
+        path_base=tmp_path,
+        original_file_path=Path("my_seed.csv"),
+    )
+    with patch("cosmos.dbt.graph._calculate_file_checksum", return_value="abc") as mock_checksum:
+        assert node.checksum == "abc"
+        assert node.checksum == "abc"
+    mock_checksum.assert_called_once()
+
+
+def test_dbt_node_checksum_cache_is_not_a_field(tmp_path):
+    (tmp_path / "my_seed.csv").write_bytes(b"id\n1\n")
+    node = DbtNode(
+        unique_id="seed.my_project.my_seed",
+        resource_type=DbtResourceType.SEED,
+        depends_on=[],
+        path_base=tmp_path,
+        original_file_path=Path("my_seed.csv"),
+    )
+    fields_before = asdict(node)
+    assert node.checksum is not None
+    assert asdict(node) == fields_before
+    assert not any(key.startswith("_") for key in asdict(node))
+
+
+def test_dbt_node_accepts_ad_hoc_attributes():
+    node = DbtNode(
+        unique_id="model.my_project.my_model",
+        resource_type=DbtResourceType.MODEL,
+        depends_on=[],
+        path_base=Path("."),
+        original_file_path=Path("model.sql"),
+    )
+    node.custom_attribute = "value"
+    assert node.custom_attribute == "value"
+
+
+def test_get_resource_type_resolves_known_values_without_enum_call():
+    with patch("cosmos.dbt.graph.DbtResourceType") as mock_resource_type:
+        assert _get_resource_type("model") is DbtResourceType.MODEL
+        assert _get_resource_type("seed") is DbtResourceType.SEED
+    mock_resource_type.assert_not_called()
+
+
+def test_get_resource_type_remembers_unknown_values():
+    with patch.dict("cosmos.dbt.graph._RESOURCE_TYPE_MAP"):
+        with patch("cosmos.dbt.graph.DbtResourceType", return_value="custom") as mock_resource_type:
+            assert _get_resource_type("custom_type") == "custom"
+            assert _get_resource_type("custom_type") == "custom"
+        mock_resource_type.assert_called_once_with("custom_type")
+
+
 class TestGetResourceNameFromUniqueId:
     def test_plain_model(self):
         assert DbtNode.get_resource_name_from_unique_id("model.my_pkg.my_model") == "my_model"
@@ -2172,6 +2225,47 @@ def test_parse_dbt_ls_output():
     assert expected_nodes == nodes
 
 
+def test_parse_dbt_ls_output_interns_package_name_and_tags():
+    fake_ls_stdout = "\n".join(
+        json.dumps(
+            {
+                "resource_type": "model",
+                "name": name,
+                "package_name": "fake-project",
+                "original_file_path": f"{name}.sql",
+                "unique_id": f"model.fake-project.{name}",
+                "tags": ["nightly"],
+                "config": {},
+            }
+        )
+        for name in ("first", "second")
+    )
+
+    nodes = parse_dbt_ls_output(Path("fake-project"), fake_ls_stdout)
+
+    first, second = nodes["model.fake-project.first"], nodes["model.fake-project.second"]
+    assert first.package_name is second.package_name
+    assert first.tags[0] is second.tags[0]
+
+
+def test_parse_dbt_ls_output_keeps_string_tags_unchanged():
+    fake_ls_stdout = json.dumps(
+        {
+            "resource_type": "model",
+            "name": "fake-model",
+            "package_name": "fake-project",
+            "original_file_path": "fake-model.sql",
+            "unique_id": "model.fake-project.fake-model",
+            "tags": "nightly",
+            "config": {},
+        }
+    )
+
+    nodes = parse_dbt_ls_output(Path("fake-project"), fake_ls_stdout)
+
+    assert nodes["model.fake-project.fake-model"].tags == "nightly"
+
+
 def test_parse_dbt_ls_output_with_json_without_tags_or_config():
     some_ls_stdout = '{"resource_type": "model", "name": "some-name", "package_name": "some-project", "original_file_path": "some-file-path.sql", "unique_id": "some-unique-id", "config": {}}'
 
@@ -3110,7 +3204,6 @@ def test_get_dbt_ls_cache_remote_cache_dir(
     }
 
     mock_remote_cache_key_path = mock_remote_cache_dir_path / "some_cache_key" / "dbt_ls_cache.json"
-    mock_remote_cache_key_path.exists.return_value = True
     mock_remote_cache_key_path.open.return_value.__enter__.return_value.read.return_value = json.dumps(cache_dict)
 
     dbt_graph = DbtGraph(project=mock_project_config)
@@ -3126,6 +3219,24 @@ def test_get_dbt_ls_cache_remote_cache_dir(
     assert result == expected_result
 
 
+@patch(object_storage_path)
+@patch("cosmos.config.ProjectConfig")
+@patch("cosmos.dbt.graph._configure_remote_cache_dir")
+def test_get_dbt_ls_cache_remote_cache_dir_missing_key(
+    mock_configure_remote_cache_dir, mock_project_config, mock_object_storage_path
+):
+    mock_remote_cache_dir_path = mock_object_storage_path.return_value
+    mock_configure_remote_cache_dir.return_value = mock_remote_cache_dir_path
+
+    mock_remote_cache_key_path = mock_remote_cache_dir_path / "some_cache_key" / "dbt_ls_cache.json"
+    mock_remote_cache_key_path.open.side_effect = FileNotFoundError
+
+    dbt_graph = DbtGraph(project=mock_project_config)
+
+    assert dbt_graph.get_dbt_ls_cache() == {}
+    mock_remote_cache_key_path.exists.assert_not_called()
+
+
 @patch(object_storage_path)
 @patch("cosmos.config.ProjectConfig")
 @patch("cosmos.dbt.graph._configure_remote_cache_dir")
@@ -3159,7 +3270,6 @@ def test_get_yaml_selectors_remote_cache_dir(
     }
 
     mock_remote_cache_key_path = mock_remote_cache_dir_path / "some_cache_key" / "yaml_selectors_cache.json"
-    mock_remote_cache_key_path.exists.return_value = True
     mock_remote_cache_key_path.open.return_value.__enter__.return_value.read.return_value = json.dumps(cache_dict)
 
     dbt_graph = DbtGraph(project=mock_project_config)
@@ -3174,6 +3284,24 @@ def test_get_yaml_selectors_remote_cache_dir(
     assert result["last_modified"] == "2024-08-13T12:34:56Z"
 
 
+@patch(object_storage_path)
+@patch("cosmos.config.ProjectConfig")
+@patch("cosmos.dbt.graph._configure_remote_cache_dir")
+def test_get_yaml_selectors_remote_cache_dir_missing_key(
+    mock_configure_remote_cache_dir, mock_project_config, mock_object_storage_path
+):
+    mock_remote_cache_dir_path = mock_object_storage_path.return_value
+    mock_configure_remote_cache_dir.return_value = mock_remote_cache_dir_path
+
+    mock_remote_cache_key_path = mock_remote_cache_dir_path / "some_cache_key" / "yaml_selectors_cache.json"
+    mock_remote_cache_key_path.open.side_effect = FileNotFoundError
+
+    dbt_graph = DbtGraph(project=mock_project_config)
+
+    assert dbt_graph.get_yaml_selectors_cache() == {}
+    mock_remote_cache_key_path.exists.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "enable_cache,enable_cache_yaml_selectors,cache_id,should_use",
     [
@@ -3323,6 +3451,25 @@ def test__relative_dirs_falls_back_when_path_outside_project():
     assert _relative_dirs([outside_path], project_path) == ["models"]
 
 
+@pytest.mark.parametrize(
+    "content", ['{"nodes": {}}', b' \n{"nodes": {}}', "null", "[1, 2]", b'"text"', "42", "[garbage"]
+)
+def test__check_manifest_root_leaves_json_like_content_to_the_parser(content):
+    _check_manifest_root(content, Path("manifest.json"))
+
+
+@pytest.mark.parametrize("content", ["", b"", "  \n ", b" \t"])
+def test__check_manifest_root_rejects_empty_content(content):
+    with pytest.raises(CosmosLoadDbtException, match="file is empty"):
+        _check_manifest_root(content, Path("manifest.json"))
+
+
+@pytest.mark.parametrize("content", ["<html></html>", b"  # not json", b"\xef\xbb\xbf{}"])
+def test__check_manifest_root_rejects_non_json_content(content):
+    with pytest.raises(CosmosLoadDbtException, match="file is not valid JSON"):
+        _check_manifest_root(content, Path("manifest.json"))
+
+
 @pytest.mark.parametrize(
     "pre_dbt_fusion_value,source_rendering_behaviour_value,expected_args_count",
     [
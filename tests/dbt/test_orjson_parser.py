@@ -8,6 +8,7 @@ Covers:
 - orjson produces identical DbtGraph output to standard json
 """
 
+import importlib.util
 from pathlib import Path
 from unittest.mock import patch
 
@@ -20,6 +21,8 @@ from cosmos.dbt.graph import CosmosLoadDbtException, DbtGraph
 SAMPLE_MANIFEST = Path(__file__).parent.parent / "sample/manifest.json"
 DBT_PROJECTS_ROOT_DIR = Path(__file__).parent.parent.parent / "dev/dags/dbt"
 
+requires_orjson = pytest.mark.skipif(importlib.util.find_spec("orjson") is None, reason="orjson not installed")
+
 
 def _make_dbt_graph(manifest_path: Path = SAMPLE_MANIFEST) -> DbtGraph:
     return DbtGraph(
@@ -29,6 +32,24 @@ def _make_dbt_graph(manifest_path: Path = SAMPLE_MANIFEST) -> DbtGraph:
     )
 
 
+@pytest.fixture(scope="module")
+def standard_json_dbt_graph() -> DbtGraph:
+    """DbtGraph loaded from SAMPLE_MANIFEST with standard json, built once and shared (read-only) by this module."""
+    dbt_graph = _make_dbt_graph()
+    with patch.object(settings, "enable_orjson_parser", False):
+        dbt_graph.load_from_dbt_manifest()
+    return dbt_graph
+
+
+@pytest.fixture(scope="module")
+def orjson_dbt_graph() -> DbtGraph:
+    """DbtGraph loaded from SAMPLE_MANIFEST with orjson, built once and shared (read-only) by this module."""
+    dbt_graph = _make_dbt_graph()
+    with patch.object(settings, "enable_orjson_parser", True):
+        dbt_graph.load_from_dbt_manifest()
+    return dbt_graph
+
+
 class TestOrjsonParserSettings:
     def test_orjson_disabled_by_default(self):
         assert settings.enable_orjson_parser is False
@@ -66,40 +87,20 @@ class TestOrjsonParserMissingDependency:
 class TestOrjsonParserEquivalence:
     """Verify orjson and standard json produce identical DbtGraph output."""
 
-    @patch.object(settings, "enable_orjson_parser", False)
-    def test_standard_json_loads_manifest(self):
-        dbt_graph = _make_dbt_graph()
-        dbt_graph.load_from_dbt_manifest()
-
-        assert len(dbt_graph.nodes) > 0
-
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("orjson"),
-        reason="orjson not installed",
-    )
-    def test_orjson_produces_same_nodes_as_standard_json(self):
-        graph_std = _make_dbt_graph()
-        with patch.object(settings, "enable_orjson_parser", False):
-            graph_std.load_from_dbt_manifest()
-
-        graph_orjson = _make_dbt_graph()
-        with patch.object(settings, "enable_orjson_parser", True):
-            graph_orjson.load_from_dbt_manifest()
+    def test_standard_json_loads_manifest(self, standard_json_dbt_graph):
+        assert len(standard_json_dbt_graph.nodes) > 0
 
-        assert graph_std.nodes.keys() == graph_orjson.nodes.keys()
+    @requires_orjson
+    def test_orjson_produces_same_nodes_as_standard_json(self, standard_json_dbt_graph, orjson_dbt_graph):
+        assert standard_json_dbt_graph.nodes.keys() == orjson_dbt_graph.nodes.keys()
+        # DbtNode is a dataclass, so this compares every field of every node
+        assert standard_json_dbt_graph.nodes == orjson_dbt_graph.nodes
 
-        for node_id in graph_std.nodes:
-            std_node = graph_std.nodes[node_id]
-            fast_node = graph_orjson.nodes[node_id]
-            assert std_node.unique_id == fast_node.unique_id
-            assert std_node.resource_type == fast_node.resource_type
-            assert std_node.depends_on == fast_node.depends_on
-            assert std_node.tags == fast_node.tags
+    @requires_orjson
+    def test_orjson_produces_same_filtered_nodes_as_standard_json(self, standard_json_dbt_graph, orjson_dbt_graph):
+        assert standard_json_dbt_graph.filtered_nodes == orjson_dbt_graph.filtered_nodes
 
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("orjson"),
-        reason="orjson not installed",
-    )
+    @requires_orjson
     def test_load_manifest_from_file_returns_same_dict(self, tmp_path):
         """_load_manifest_from_file returns the same structure regardless of parser."""
         import json
@@ -139,6 +140,16 @@ class TestOrjsonParserEquivalence:
             with pytest.raises(CosmosLoadDbtException, match="expected top-level JSON object"):
                 dbt_graph._load_manifest_from_file(manifest_file)
 
+    def test_load_manifest_from_file_rejects_non_json_content_before_parsing(self, tmp_path):
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text("  <html></html>")
+        dbt_graph = _make_dbt_graph(manifest_file)
+
+        with patch.object(settings, "enable_orjson_parser", False), patch("json.loads") as mock_loads:
+            with pytest.raises(CosmosLoadDbtException, match="file is not valid JSON \\(content starts with '<'\\)"):
+                dbt_graph._load_manifest_from_file(manifest_file)
+        mock_loads.assert_not_called()
+
     def test_load_manifest_from_file_raises_on_empty_file(self, tmp_path):
         manifest_file = tmp_path / "manifest.json"
         manifest_file.write_text("")
@@ -148,10 +159,7 @@ class TestOrjsonParserEquivalence:
             with pytest.raises(CosmosLoadDbtException, match="file is empty"):
                 dbt_graph._load_manifest_from_file(manifest_file)
 
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("orjson"),
-        reason="orjson not installed",
-    )
+    @requires_orjson
     def test_load_manifest_from_file_raises_on_empty_file_orjson(self, tmp_path):
         manifest_file = tmp_path / "manifest.json"
         manifest_file.write_text("")
@@ -171,10 +179,7 @@ class TestOrjsonParserEquivalence:
             with pytest.raises(CosmosLoadDbtException, match="file is not valid JSON"):
                 dbt_graph._load_manifest_from_file(manifest_file)
 
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("orjson"),
-        reason="orjson not installed",
-    )
+    @requires_orjson
     def test_load_manifest_from_file_raises_on_invalid_root_type_orjson(self, tmp_path):
         """Non-dict, non-null roots (e.g. JSON arrays) raise CosmosLoadDbtException."""
         manifest_file = tmp_path / "manifest.json"
@@ -186,10 +191,7 @@ class TestOrjsonParserEquivalence:
             with pytest.raises(CosmosLoadDbtException, match="expected top-level JSON object"):
                 dbt_graph._load_manifest_from_file(manifest_file)
 
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("orjson"),
-        reason="orjson not installed",
-    )
+    @requires_orjson
     def test_load_manifest_from_file_raises_on_truncated_json_orjson(self, tmp_path):
         """orjson path: raises CosmosLoadDbtException on malformed JSON."""
         manifest_file = tmp_path / "manifest.json"
@@ -199,3 +201,13 @@ class TestOrjsonParserEquivalence:
         with patch.object(settings, "enable_orjson_parser", True):
             with pytest.raises(CosmosLoadDbtException, match="file is not valid JSON"):
                 dbt_graph._load_manifest_from_file(manifest_file)
+
+    @requires_orjson
+    def test_load_manifest_from_file_raises_on_whitespace_file_orjson(self, tmp_path):
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text("  \n ")
+        dbt_graph = _make_dbt_graph(manifest_file)
+
+        with patch.object(settings, "enable_orjson_parser", True):
+            with pytest.raises(CosmosLoadDbtException, match="file is empty"):
+                dbt_graph._load_manifest_from_file(manifest_file)
@@ -5,10 +5,12 @@ from unittest.mock import patch
 
 import pytest
 import yaml
+from jinja2 import Template
 from packaging.version import Version
 
 from cosmos.constants import DBT_DEFAULT_PACKAGES_FOLDER, DBT_PROJECT_FILENAME, PACKAGE_LOCKFILE_YML
 from cosmos.dbt.project import (
+    _compile_template,
     _resolve_dags_folder,
     _resolve_env_var,
     change_working_directory,
@@ -23,9 +25,15 @@ from cosmos.dbt.project import (
     remove_dags_folder_from_pythonpath,
 )
 from cosmos.exceptions import CosmosValueError
+from tests.utils import YamlDumper
 
 DBT_PROJECTS_ROOT_DIR = Path(__file__).parent.parent.parent / "dev/dags/dbt"
 
+# Rendered once at import time: most tests only need this fixed content, so they skip the YAML serialization
+CUSTOM_PACKAGES_DBT_PROJECT_YML = yaml.dump(
+    {"packages-install-path": "custom_dbt_packages"}, Dumper=YamlDumper
+).encode()
+
 
 def test_copy_manifest_file_if_exists(tmpdir):
     source_manifest = tmpdir / "manifest.json"
@@ -52,9 +60,18 @@ def test_does_nothing_if_manifest_missing(tmpdir):
     assert not target_folder.exists()
 
 
-def write_dbt_project_yml(path: Path, content: dict):
-    with open(path / "dbt_project.yml", "w") as fp:
-        yaml.dump(content, fp)
+def test_copy_manifest_file_if_exists_skips_empty_path(tmp_path):
+    dbt_project_folder = tmp_path / "dbt_project"
+
+    copy_manifest_file_if_exists("", dbt_project_folder)
+
+    assert not dbt_project_folder.exists()
+
+
+def write_dbt_project_yml(path: Path, content: dict | bytes):
+    if isinstance(content, dict):
+        content = yaml.dump(content, Dumper=YamlDumper).encode()
+    Path(path, DBT_PROJECT_FILENAME).write_bytes(content)
     return path
 
 
@@ -63,10 +80,28 @@ def test_returns_default_when_file_missing(tmpdir):
     assert result == "dbt_packages"
 
 
-def test_returns_default_when_key_missing(tmpdir):
-    write_dbt_project_yml(tmpdir, {"name": "test_project"})
-    result = get_dbt_packages_subpath(tmpdir)
-    assert result == "dbt_packages"
+def test_returns_default_when_source_folder_is_a_file(tmp_path):
+    source_file = tmp_path / "not_a_project"
+    source_file.write_text("", encoding="utf-8")
+    assert get_dbt_packages_subpath(source_file) == "dbt_packages"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        pytest.param({"name": "test_project"}, "dbt_packages", id="default_when_key_missing"),
+        pytest.param(CUSTOM_PACKAGES_DBT_PROJECT_YML, "custom_dbt_packages", id="custom_path"),
+        pytest.param(
+            {"packages-install-path": 'dbt_packages_{{ env_var("ENV_SUFFIX") }}'},
+            "dbt_packages_prod",
+            id="env_var_template",
+        ),
+    ],
+)
+@patch.dict(os.environ, {"ENV_SUFFIX": "prod"})
+def test_get_dbt_packages_subpath(tmp_path, content, expected):
+    write_dbt_project_yml(tmp_path, content)
+    assert get_dbt_packages_subpath(tmp_path) == expected
 
 
 def test_returns_default_on_invalid_yaml(tmpdir, caplog):
@@ -80,12 +115,6 @@ def test_returns_default_on_invalid_yaml(tmpdir, caplog):
     assert "Unable to read" in caplog.text
 
 
-def test_returns_custom_path_when_defined(tmpdir):
-    write_dbt_project_yml(tmpdir, {"packages-install-path": "custom_dbt_packages"})
-    result = get_dbt_packages_subpath(tmpdir)
-    assert result == "custom_dbt_packages"
-
-
 @patch.dict(os.environ, {"MY_PATH": "custom_packages"})
 def test_resolve_env_var_with_simple_env_var():
     """Test _resolve_env_var with and without a simple env_var reference."""
@@ -129,12 +158,35 @@ def test_resolve_env_var_with_complex_template_unset_var():
     assert result == "dbt_packages"
 
 
-@patch.dict(os.environ, {"ENV_SUFFIX": "prod"})
-def test_get_dbt_packages_subpath_with_env_var_template(tmpdir):
-    """Test get_dbt_packages_subpath with env_var in packages-install-path."""
-    write_dbt_project_yml(tmpdir, {"packages-install-path": 'dbt_packages_{{ env_var("ENV_SUFFIX") }}'})
-    result = get_dbt_packages_subpath(tmpdir)
-    assert result == "dbt_packages_prod"
+def test_resolve_env_var_compiles_template_once_and_renders_current_env():
+    _compile_template.cache_clear()
+    template = '{{ env_var("CACHED_TEMPLATE_VAR") }}'
+
+    with patch("cosmos.dbt.project.Template", wraps=Template) as mock_template:
+        with patch.dict(os.environ, {"CACHED_TEMPLATE_VAR": "first"}):
+            assert _resolve_env_var(template) == "first"
+        with patch.dict(os.environ, {"CACHED_TEMPLATE_VAR": "second"}):
+            assert _resolve_env_var(template) == "second"
+
+    assert mock_template.call_count == 1
+
+
+def test_get_dbt_packages_subpath_reuses_parsed_dbt_project_yml(tmp_path):
+    write_dbt_project_yml(tmp_path, CUSTOM_PACKAGES_DBT_PROJECT_YML)
+
+    with patch("cosmos.dbt.project.yaml.load", wraps=yaml.load) as mock_load:
+        assert get_dbt_packages_subpath(tmp_path) == "custom_dbt_packages"
+        assert get_dbt_packages_subpath(tmp_path) == "custom_dbt_packages"
+
+    assert mock_load.call_count == 1
+
+
+def test_get_dbt_packages_subpath_reparses_changed_dbt_project_yml(tmp_path):
+    write_dbt_project_yml(tmp_path, CUSTOM_PACKAGES_DBT_PROJECT_YML)
+    assert get_dbt_packages_subpath(tmp_path) == "custom_dbt_packages"
+
+    write_dbt_project_yml(tmp_path, {"packages-install-path": "other_custom_dbt_packages"})
+    assert get_dbt_packages_subpath(tmp_path) == "other_custom_dbt_packages"
 
 
 def test_create_symlinks(tmp_path):
@@ -148,6 +200,21 @@ def test_create_symlinks(tmp_path):
         assert child.name not in ("logs", "target", "profiles.yml", "dbt_packages")
 
 
+def test_create_symlinks_ignores_dbt_packages(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    write_dbt_project_yml(project_dir, CUSTOM_PACKAGES_DBT_PROJECT_YML)
+    (project_dir / "custom_dbt_packages").mkdir()
+    (project_dir / "models").mkdir()
+    (project_dir / "profiles.yml").touch()
+    tmp_dir = tmp_path / "dbt-project"
+    tmp_dir.mkdir()
+
+    create_symlinks(project_dir, tmp_dir, ignore_dbt_packages=True)
+
+    assert sorted(child.name for child in tmp_dir.iterdir()) == ["dbt_project.yml", "models"]
+
+
 def test_create_symlinks_missing_project_raises_cosmos_value_error(tmp_path):
     """A missing project path raises an actionable CosmosValueError instead of a bare FileNotFoundError."""
     tmp_dir = tmp_path / "dbt-project"
@@ -255,6 +322,10 @@ def test_has_non_empty_dependencies_file_is_false_in_empty_dir(tmpdir):
     assert not has_non_empty_dependencies_file(tmpdir)
 
 
+def test_has_non_empty_dependencies_file_is_false_when_project_dir_missing(tmp_path):
+    assert not has_non_empty_dependencies_file(tmp_path / "does-not-exist")
+
+
 @patch("cosmos.dbt.project.shutil.copy2")
 @patch("cosmos.dbt.project.shutil.copytree")
 @patch("cosmos.dbt.project.os.makedirs")
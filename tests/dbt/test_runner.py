@@ -1,7 +1,6 @@
 import os
 import shutil
 import sys
-import tempfile
 import types
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -24,19 +23,16 @@ DBT_PROJECT_PATH = Path(__file__).parent.parent.parent / "dev/dags/dbt/jaffle_sh
 
 
 @pytest.fixture
-def valid_dbt_project_dir():
+def valid_dbt_project_dir(tmp_path):
     """
     Creates a plain dbt project structure, which does not contain logs or target folders.
     """
-    tmp_dir = Path(tempfile.mkdtemp())
     source_proj_dir = DBT_PROJECT_PATH
-    target_proj_dir = tmp_dir / "jaffle_shop"
+    target_proj_dir = tmp_path / "jaffle_shop"
     shutil.copytree(source_proj_dir, target_proj_dir)
     shutil.rmtree(target_proj_dir / "logs", ignore_errors=True)
     shutil.rmtree(target_proj_dir / "target", ignore_errors=True)
-    yield target_proj_dir
-
-    shutil.rmtree(tmp_dir, ignore_errors=True)  # delete directory
+    return target_proj_dir
 
 
 @pytest.fixture
@@ -4,7 +4,15 @@ import pytest
 
 from cosmos.constants import DbtResourceType
 from cosmos.dbt.graph import DbtNode
-from cosmos.dbt.selector import NodeSelector, SelectorConfig, YamlSelectors, _node_fqn_str, select_nodes
+from cosmos.dbt.selector import (
+    NodeSelector,
+    SelectorConfig,
+    YamlSelectors,
+    _check_nested_value_in_dict,
+    _node_fqn_str,
+    _parse_nested_value_pattern,
+    select_nodes,
+)
 from cosmos.exceptions import CosmosValueError
 
 SAMPLE_PROJ_PATH = Path("/home/user/path/dbt-proj/")
@@ -2138,3 +2146,34 @@ def test_selector_reference_resolves_from_cache():
 
     assert base_result == {"select": ["tag:nightly"], "exclude": None}
     assert reference_result == base_result
+
+
+def test_parse_nested_value_pattern():
+    assert _parse_nested_value_pattern("meta.frequency:daily") == (("meta", "frequency"), "daily")
+
+
+def test_check_nested_value_in_dict_parses_pattern_once():
+    _parse_nested_value_pattern.cache_clear()
+    config = {"meta": {"frequency": "daily"}}
+    other_config = {"meta": {"frequency": "weekly"}}
+
+    assert _check_nested_value_in_dict(config, "meta.frequency:daily")
+    assert not _check_nested_value_in_dict(other_config, "meta.frequency:daily")
+
+    cache_info = _parse_nested_value_pattern.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+@pytest.mark.parametrize(
+    "config, pattern, expected",
+    [
+        ({"meta": {"frequency": "daily"}}, "meta.frequency:daily", True),
+        ({"meta": {"frequency": "weekly"}}, "meta.frequency:daily", False),
+        ({"meta": {}}, "meta.frequency:daily", False),
+        ({"meta": {"frequency": None}}, "meta.frequency:daily", False),
+        ({}, "meta.frequency:daily", False),
+    ],
+)
+def test_check_nested_value_in_dict(config, pattern, expected):
+    assert _check_nested_value_in_dict(config, pattern) is expected
@@ -176,8 +176,6 @@ def test_mock_bigquery_adapter():
 
     _mock_bigquery_adapter()
 
-    assert hasattr(BigQueryConnectionManager, "execute")
-
     response, table = BigQueryConnectionManager.execute(None, sql="SELECT 1")
     assert response._message == "mock_bigquery_adapter_response"
     assert table is not None
@@ -7,14 +7,15 @@ from cosmos.operators._watcher.base import BaseConsumerSensor, _process_dbt_log_
 from cosmos.operators.local import DbtRunLocalOperator
 
 
+class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
+    something_to_be_implemented = True
+
+
 class TestBaseConsumerSensor:
 
     def test_extra_context_is_stored_on_instance(self):
         """Consumer sensor stores extra_context so it is available at runtime."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         extra_context = {"dbt_node_config": {"unique_id": "model.jaffle_shop.stg_orders"}, "run_id": "run_123"}
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
@@ -29,9 +30,6 @@ class TestBaseConsumerSensor:
     def test_extra_context_defaults_to_empty_dict_when_not_passed(self):
         """When extra_context is not in kwargs, sensor.extra_context is {}."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
@@ -119,9 +117,6 @@ class TestBaseConsumerSensor:
     def test_execute_complete_raises_airflow_skip_exception_when_status_is_skipped(self):
         """execute_complete raises AirflowSkipException when the trigger sends status='skipped'."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
@@ -138,9 +133,6 @@ class TestBaseConsumerSensor:
 
         Regression for #2456 - removing the per-poll trigger log must not drop the single terminal log line."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
@@ -159,9 +151,6 @@ class TestBaseConsumerSensor:
     def test_poke_raises_airflow_skip_exception_when_status_is_skipped(self):
         """poke raises AirflowSkipException when node status is 'skipped'."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
@@ -185,9 +174,6 @@ class TestBaseConsumerSensor:
         """poke must not log the per-node dbt event while the node is still running (status None); it logs
         once the node is terminal. Regression for #2456 on the non-deferrable path."""
 
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
@@ -224,9 +210,6 @@ class TestHandleNoDbtNodeStatus:
     """Tests for BaseConsumerSensor._handle_no_dbt_node_status."""
 
     def _make_sensor(self):
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         extra_context = {"dbt_node_config": {"unique_id": "model.jaffle_shop.stg_orders"}}
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
@@ -281,9 +264,6 @@ class TestBaseConsumerSensorEmitDatasets:
     ExecutionMode.WATCHER* consumer (SUBPROCESS, Kubernetes, GCP GKE)."""
 
     def _make_sensor(self, emit_datasets=True):
-        class SubclassBaseConsumerSensor(BaseConsumerSensor, DbtRunLocalOperator):
-            something_to_be_implemented = True
-
         sensor = SubclassBaseConsumerSensor(
             task_id="test_sensor",
             producer_task_id="dbt_run_local",
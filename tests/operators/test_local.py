@@ -2127,7 +2127,8 @@ def test_upload_compiled_sql_should_upload(mock_configure_remote, mock_object_st
         extra_context={"dbt_dag_task_group_identifier": "test_dag"},
     )
 
-    mock_configure_remote.return_value = ("mock_remote_path", "mock_conn_id")
+    mock_remote_path = MagicMock()
+    mock_configure_remote.return_value = (mock_remote_path, "mock_conn_id")
 
     tmp_project_dir = "/fake/tmp/project"
     source_compiled_dir = Path(tmp_project_dir) / "target" / "compiled"
@@ -2148,9 +2149,9 @@ def test_upload_compiled_sql_should_upload(mock_configure_remote, mock_object_st
 
         for file_path in files:
             rel_path = os.path.relpath(str(file_path), str(source_compiled_dir))
-            expected_dest_path = f"mock_remote_path/test_dag/test_run_id/compiled/{rel_path.lstrip('/')}"
-            mock_object_storage_path.assert_any_call(expected_dest_path, conn_id="mock_conn_id")
-            mock_object_storage_path.return_value.copy.assert_any_call(mock_object_storage_path.return_value)
+            mock_remote_path.__truediv__.assert_any_call(f"test_dag/test_run_id/compiled/{rel_path.lstrip('/')}")
+        mock_object_storage_path.return_value.copy.assert_called_with(mock_remote_path.__truediv__.return_value)
+        assert mock_object_storage_path.return_value.copy.call_count == 2
 
 
 def test_mock_dbt_adapter_valid_context():
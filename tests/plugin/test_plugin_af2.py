@@ -390,7 +390,9 @@ def test_has_access_with_permissions_in_astro_must_include_custom_menu(url_path,
 
 
 def test_cosmos_plugin_enabled_on_airflow2():
-    assert cosmos.plugin.CosmosPlugin is not None
+    # Compared by qualified name: other tests here reload cosmos.plugin.airflow2, which rebinds the class object
+    assert cosmos.plugin.CosmosPlugin.__module__ == "cosmos.plugin.airflow2"
+    assert cosmos.plugin.CosmosPlugin.__qualname__ == "CosmosPlugin"
 
 
 @pytest.mark.integration
@@ -438,8 +438,6 @@ def test_plugin_registers_listeners():
 
     plugin = CosmosAF3Plugin()
 
-    assert hasattr(plugin, "listeners"), "Plugin must define a `listeners` attribute"
-
     assert dag_run_listener in plugin.listeners, "CosmosAF3Plugin.listeners must include dag_run_listener module"
 
 
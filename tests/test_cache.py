@@ -466,52 +466,40 @@ def test_cache_package_lockfile_enabled(mock_path_is_file):
 
 
 @pytest.fixture
-def mock_package_lockfile():
-    # Create a temporary YAML file with test data
+def mock_package_lockfile(tmp_path):
+    # Create a temporary YAML file with test data; tmp_path keeps it unique per test (and per xdist worker)
     yaml_data = """
     packages:
       - package: dbt-labs/dbt_utils
         version: 1.1.1
     sha1_hash: a158c48c59c2bb7d729d2a4e215aabe5bb4f3353
     """
-    tmp_file = Path("test_package-lock.yml")
-    with open(tmp_file, "w") as file:
-        file.write(yaml_data)
-    yield tmp_file
-    # Clean up: delete the temporary file after the test
-    tmp_file.unlink()
+    tmp_file = tmp_path / "test_package-lock.yml"
+    tmp_file.write_text(yaml_data)
+    return tmp_file
 
 
-def test_get_sha1_hash():
+def test_get_sha1_hash(tmp_path):
     profile_lock_content = """
     packages:
       - package: dbt-labs/dbt_utils
         version: 1.1.1
     sha1_hash: a158c48c59c2bb7d729d2a4e215aabe5bb4f3353
     """
-    tmp_file = Path("package-lock.yml")
-    with open(tmp_file, "w") as file:
-        file.write(profile_lock_content)
+    tmp_file = tmp_path / "package-lock.yml"
+    tmp_file.write_text(profile_lock_content)
 
     sha1_hash = _get_sha1_hash(tmp_file)
     assert sha1_hash == "a158c48c59c2bb7d729d2a4e215aabe5bb4f3353"
-    tmp_file.unlink()
-
-
-def _test_tmp_dir(dir_name: str):
-    # Create a temporary directory for cache_dir
-    with tempfile.TemporaryDirectory() as temp_dir:
-        cache_dir = Path(temp_dir) / "test_cache"
-        cache_dir.mkdir()
-        return cache_dir
 
 
 @patch("cosmos.cache.cache_dir")
 @patch("cosmos.cache._get_sha1_hash")
-def test_get_latest_cached_package_lockfile_with_cache(mock_get_sha, cache_dir):
+def test_get_latest_cached_package_lockfile_with_cache(mock_get_sha, cache_dir, tmp_path):
     # Create a fake cached lockfile
-    project_dir = _test_tmp_dir("test_project")
-    cache_dir.return_value = _test_tmp_dir("test_cache")
+    project_dir = tmp_path / "test_project"
+    project_dir.mkdir()
+    cache_dir.return_value = tmp_path / "test_cache"
     cache_identifier = project_dir.name
     cached_profile_lockfile = cache_dir / cache_identifier / "package-lock.yml"
     cached_profile_lockfile.parent.mkdir(parents=True, exist_ok=True)
@@ -524,14 +512,15 @@ def test_get_latest_cached_package_lockfile_with_cache(mock_get_sha, cache_dir):
 
 
 @patch("cosmos.cache._get_sha1_hash")
-def test_get_latest_cached_lockfile_with_no_cache(mock_get_sha):
-    project_dir = _test_tmp_dir("test_project")
+def test_get_latest_cached_lockfile_with_no_cache(mock_get_sha, tmp_path):
+    project_dir = tmp_path / "test_project"
     project_package_lockfile = project_dir / "package-lock.yml"
     project_package_lockfile.parent.mkdir(parents=True, exist_ok=True)
     project_package_lockfile.touch()
 
-    # Test case where there is a cached file
-    result = _get_latest_cached_package_lockfile(project_dir)
+    # Test case where there is no cached file yet: it is created under the (temporary) cache dir
+    with patch("cosmos.cache.cache_dir", tmp_path / "cache"):
+        result = _get_latest_cached_package_lockfile(project_dir)
     assert result.exists()
 
 
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,15 +16,19 @@ from cosmos.io import (
     upload_to_gcp_gs,
 )
 
+# The upload helpers only read attributes from these, so plain namespaces are enough (no call tracking needed)
+FAKE_DAG = SimpleNamespace(dag_id="test_dag")
+FAKE_TASK_INSTANCE = SimpleNamespace(task_id="test_task", try_number=1)
+
 
 @pytest.fixture
 def dummy_kwargs():
     """Fixture for reusable test kwargs."""
     return {
         "context": {
-            "dag": MagicMock(dag_id="test_dag"),
+            "dag": FAKE_DAG,
             "run_id": "test_run_id",
-            "task_instance": MagicMock(task_id="test_task", try_number=1),
+            "task_instance": FAKE_TASK_INSTANCE,
         },
         "bucket_name": "test_bucket",
         "container_name": "test_container",
@@ -63,10 +68,11 @@ def test_upload_artifacts_to_aws_s3_tarball(dummy_kwargs):
 
         mock_tar.add.assert_called_once_with("/project_dir/target", arcname="target")
         hook_instance = mock_hook.return_value
-        hook_instance.load_bytes.assert_called_once()
-        call_kwargs = hook_instance.load_bytes.call_args.kwargs
+        hook_instance.load_file_obj.assert_called_once()
+        call_kwargs = hook_instance.load_file_obj.call_args.kwargs
         assert call_kwargs["key"] == "test_dag/test_run_id/test_task/1/target.tar.gz"
-        assert "bytes_data" in call_kwargs
+        assert call_kwargs["file_obj"].tell() == 0
+        hook_instance.load_bytes.assert_not_called()
         hook_instance.load_file.assert_not_called()
 
 
@@ -226,6 +232,59 @@ def test_upload_artifacts_to_cloud_storage_success(dummy_kwargs):
 
         mock_configure.assert_called_once()
         assert mock_copy.call_count == 2
+        assert {call.args[0] for call in mock_copy.call_args_list} == {
+            Path("/dest/test_dag/test_run_id/test_task/1/target/file1.txt"),
+            Path("/dest/test_dag/test_run_id/test_task/1/target/file2.txt"),
+        }
+
+
+def test_upload_artifacts_to_cloud_storage_keeps_remote_conn_id(dummy_kwargs):
+    """Destinations derived from the configured ObjectStoragePath keep its connection."""
+    from cosmos.io import ObjectStoragePath
+
+    dest_target_dir = ObjectStoragePath("memory://bucket/dest", conn_id="remote_conn")
+    with (
+        patch("cosmos.io._configure_remote_target_path", return_value=(dest_target_dir, "remote_conn")),
+        patch("pathlib.Path.rglob") as mock_rglob,
+        patch("cosmos.io.ObjectStoragePath.copy") as mock_copy,
+    ):
+        mock_file1 = MagicMock(spec=Path)
+        mock_file1.is_file.return_value = True
+        mock_file1.__str__.return_value = "/project_dir/target/file1.txt"
+
+        mock_file2 = MagicMock(spec=Path)
+        mock_file2.is_file.return_value = True
+        mock_file2.__str__.return_value = "/project_dir/target/subdir/file2.txt"
+
+        mock_rglob.return_value = [mock_file1, mock_file2]
+
+        upload_to_cloud_storage("/project_dir", **dummy_kwargs)
+
+    destinations = [call.args[0] for call in mock_copy.call_args_list]
+    assert sorted(str(destination) for destination in destinations) == [
+        "memory://bucket/dest/test_dag/test_run_id/test_task/1/target/file1.txt",
+        "memory://bucket/dest/test_dag/test_run_id/test_task/1/target/subdir/file2.txt",
+    ]
+    assert all(destination.conn_id == "remote_conn" for destination in destinations)
+
+
+def test_upload_artifacts_to_cloud_storage_propagates_upload_error(dummy_kwargs):
+    """An upload failing in one of the worker threads is re-raised to the caller."""
+    with (
+        patch(
+            "cosmos.io._configure_remote_target_path",
+            return_value=(Path("/dest"), "conn_id"),
+        ),
+        patch("pathlib.Path.rglob") as mock_rglob,
+        patch("cosmos.io.ObjectStoragePath.copy", side_effect=OSError("upload failed")),
+    ):
+        mock_file = MagicMock(spec=Path)
+        mock_file.is_file.return_value = True
+        mock_file.__str__.return_value = "/project_dir/target/file1.txt"
+        mock_rglob.return_value = [mock_file]
+
+        with pytest.raises(OSError, match="upload failed"):
+            upload_to_cloud_storage("/project_dir", **dummy_kwargs)
 
 
 @patch("cosmos.io.settings.remote_target_path", "s3://bucket/path/to/file")
@@ -3,6 +3,8 @@ import warnings
 from importlib import reload
 from unittest.mock import patch
 
+import pytest
+
 from cosmos import settings
 
 
@@ -84,3 +86,21 @@ def test_watcher_dbt_execution_queue_defaults_to_none_without_warning():
     assert settings.watcher_dbt_producer_queue is None
     assert settings.watcher_dbt_retry_queue is None
     assert not any(issubclass(w.category, DeprecationWarning) for w in caught)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, False),
+        ("", False),
+        ("0", False),
+        ("f", False),
+        (" False ", False),
+        ("NONE", False),
+        ("1", True),
+        ("true", True),
+        ("yes", True),
+    ],
+)
+def test_convert_to_boolean(value, expected):
+    assert settings.convert_to_boolean(value) is expected
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any
 
 import sqlalchemy
+import yaml
 from airflow.configuration import secrets_backend_list
 from airflow.exceptions import AirflowSkipException
 from airflow.models.dag import DAG
@@ -25,6 +26,9 @@ from cosmos.constants import AIRFLOW_VERSION
 
 log = logging.getLogger(__name__)
 
+# The libyaml-backed dumper is much faster than the pure Python one, when PyYAML was built with it
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def make_dag_bag(*args: Any, **kwargs: Any) -> Any:
     """Construct a ``DagBag``, dropping ``include_examples`` on Airflow >= 3.3.